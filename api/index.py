@@ -1,9 +1,21 @@
 from flask import Flask, render_template, request, jsonify
+import atexit
+import codecs
+import functools
+import hashlib
 import json
 import os
+import queue
 from datetime import datetime
 from urllib.parse import urlparse
 import re
+import secrets
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
@@ -13,24 +25,252 @@ app = Flask(__name__)
 VERCEL = os.environ.get('VERCEL') == '1'
 BOOKMARKS_FILE = '/tmp/bookmarks.json' if VERCEL else 'bookmarks.json'
 
-def load_bookmarks():
-    """Load bookmarks from file or return empty list"""
-    if os.path.exists(BOOKMARKS_FILE):
+# Netscape bookmark format patterns, compiled once for all imports.
+# They match raw bytes so uploads never need to be decoded as a whole.
+_NETSCAPE_A_RE = re.compile(rb'<A\s+HREF="([^"]+)"[^>]*ADD_DATE="?(\d+)"?[^>]*>([^<]+)</A>', re.IGNORECASE)
+_NETSCAPE_DD_RE = re.compile(rb'<DD>([^<]+)')
+
+# Descriptions are looked for within this many characters after each <A> tag;
+# UTF-8 needs at most 4 bytes per character to cover that in bytes
+_NETSCAPE_DD_WINDOW = 200
+_NETSCAPE_DD_WINDOW_BYTES = 4 * _NETSCAPE_DD_WINDOW
+
+# Translation table for escaping HTML in a single pass
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+# Parsed bookmarks are cached in memory and only re-read when the file's
+# mtime changes, so most requests skip the JSON decode entirely.
+# 'urls' maps each bookmark's normalized URL (computed once, at load or
+# insert time) to its id for O(1) duplicate checks and 'by_id' maps ids to
+# bookmark dicts for O(1) lookups; both are kept in sync by the mutating
+# endpoints. 'json_bytes' is the serialized GET /api/bookmarks body, taken
+# straight from the bytes read or written, and 'etag' its content hash.
+# 'categories_json' and 'export_html' are the categories response and
+# rendered HTML export; they are built lazily and dropped whenever the
+# bookmarks are reloaded or saved. 'version' is bumped on every reload or
+# save, since the file mtime lags behind memory with write-behind saves.
+_CACHE = {
+    'mtime': None,
+    'data': None,
+    'version': 0,
+    'urls': {},
+    'by_id': {},
+    'json_bytes': None,
+    'etag': None,
+    'categories_json': None,
+    'export_html': None,
+    'export_html_version': None,
+}
+_CACHE_LOCK = threading.Lock()
+
+# Held by mutating endpoints across load -> mutate -> save so concurrent
+# writers can't interleave on the shared cached list and its indexes
+_MUTATION_LOCK = threading.RLock()
+
+# Serializes writers of the temp file
+_FILE_LOCK = threading.Lock()
+
+# Outside Vercel (where the process may be frozen as soon as the response is
+# sent) saves only update the cache and queue the serialized bookmarks for a
+# background thread to write, coalescing bursts into a single disk write.
+# The thread is started lazily per process so pre-fork servers (e.g.
+# gunicorn --preload) get a writer in each worker, not just the master.
+WRITE_BEHIND = not VERCEL
+_write_queue = queue.Queue()
+_writer_pid = None
+_WRITER_START_LOCK = threading.Lock()
+
+# Longest we wait at interpreter exit for queued saves to reach disk
+WRITE_FLUSH_TIMEOUT = 10
+
+# Placeholder for the export date in the cached HTML export
+_EXPORT_DATE_SENTINEL = '{{EXPORT_DATE}}'
+
+def _normalize_url(url):
+    """Normalize a URL for case-insensitive duplicate detection"""
+    return url.lower().rstrip('/')
+
+def _forget_url(bookmark):
+    """Remove a bookmark's URL from the duplicate index if it owns the entry"""
+    normalized_url = _normalize_url(bookmark.get('url', ''))
+    if _CACHE['urls'].get(normalized_url) == bookmark.get('id'):
+        del _CACHE['urls'][normalized_url]
+
+def _bookmarks_mtime():
+    """Return the bookmarks file mtime in ns, or 0 if it doesn't exist"""
+    try:
+        return os.stat(BOOKMARKS_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+def _json_loads(data):
+    """Decode JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+def _json_dumps(obj):
+    """Encode obj as compact UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
         try:
-            with open(BOOKMARKS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects values stdlib json accepts, e.g. ints over 64 bits
+            pass
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+@functools.lru_cache(maxsize=None)
+def _iso_to_timestamp(iso):
+    """Convert an ISO 8601 date to a Unix timestamp, memoized across exports"""
+    return int(datetime.fromisoformat(iso).timestamp())
+
+def escape_html(text):
+    """Escape HTML special characters to prevent XSS"""
+    return str(text).translate(_HTML_ESCAPE_TABLE)
+
+def _load_bookmarks_locked():
+    """Load bookmarks like load_bookmarks; the caller must hold _CACHE_LOCK"""
+    mtime = _bookmarks_mtime()
+    if _CACHE['data'] is not None and _CACHE['mtime'] == mtime:
+        return _CACHE['data']
+    
+    bookmarks = []
+    data = None
+    if mtime:
+        try:
+            with open(BOOKMARKS_FILE, 'rb') as f:
+                data = f.read()
+            bookmarks = _json_loads(data)
         except:
-            return []
-    return []
+            bookmarks = []
+            data = None
+    
+    _CACHE['mtime'] = mtime
+    _CACHE['data'] = bookmarks
+    _CACHE['version'] += 1
+    _CACHE['urls'] = {_normalize_url(b.get('url', '')): b.get('id') for b in bookmarks}
+    _CACHE['by_id'] = {b.get('id'): b for b in bookmarks}
+    _CACHE['json_bytes'] = data
+    _CACHE['etag'] = None
+    _CACHE['categories_json'] = None
+    _CACHE['export_html'] = None
+    return bookmarks
 
-def save_bookmarks(bookmarks):
-    """Save bookmarks to file"""
+def load_bookmarks():
+    """Load bookmarks from cache, file, or return empty list"""
+    with _CACHE_LOCK:
+        return _load_bookmarks_locked()
+
+def _write_bookmarks_file(data):
+    """Atomically replace the bookmarks file with already-serialized data"""
     # Ensure directory exists if needed (for /tmp, it already exists)
     dir_path = os.path.dirname(BOOKMARKS_FILE)
     if dir_path and not os.path.exists(dir_path):
         os.makedirs(dir_path, exist_ok=True)
-    with open(BOOKMARKS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(bookmarks, f, indent=2, ensure_ascii=False)
+    with _FILE_LOCK:
+        # Write to a temp file and swap it in so a crash mid-write can't
+        # leave a truncated bookmarks file behind
+        tmp_file = BOOKMARKS_FILE + '.tmp'
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # Hand the whole payload to the kernel in a single write
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # Record our own mtime under the cache lock so readers never mistake
+        # this write for an external change and reload older data from disk
+        with _CACHE_LOCK:
+            os.replace(tmp_file, BOOKMARKS_FILE)
+            _CACHE['mtime'] = _bookmarks_mtime()
+
+def _write_behind_worker():
+    """Write queued snapshots to disk, keeping only the newest of a burst"""
+    while True:
+        data = _write_queue.get()
+        pending = 1
+        try:
+            while True:
+                try:
+                    data = _write_queue.get_nowait()
+                    pending += 1
+                except queue.Empty:
+                    break
+            _write_bookmarks_file(data)
+        except Exception:
+            app.logger.exception('Failed to write bookmarks file')
+        finally:
+            for _ in range(pending):
+                _write_queue.task_done()
+
+def _ensure_writer():
+    """Start the write-behind thread if this process doesn't have one yet"""
+    global _write_queue, _writer_pid
+    pid = os.getpid()
+    if _writer_pid == pid:
+        return
+    with _WRITER_START_LOCK:
+        if _writer_pid == pid:
+            return
+        if _writer_pid is not None:
+            # Forked from a process that already had a writer; its queue
+            # state (and thread) didn't survive the fork, so start fresh
+            _write_queue = queue.Queue()
+        threading.Thread(target=_write_behind_worker, name='bookmarks-writer', daemon=True).start()
+        _writer_pid = pid
+
+def flush_pending_writes(timeout=None):
+    """Wait for queued saves to reach disk, returning False on timeout"""
+    if not WRITE_BEHIND or _writer_pid != os.getpid():
+        return True
+    write_queue = _write_queue
+    with write_queue.all_tasks_done:
+        return write_queue.all_tasks_done.wait_for(lambda: not write_queue.unfinished_tasks, timeout)
+
+if WRITE_BEHIND:
+    atexit.register(flush_pending_writes, WRITE_FLUSH_TIMEOUT)
+
+def _drop_cache():
+    """Forget the cached bookmarks so the next load re-reads the file"""
+    # Let earlier queued saves land first so the reload doesn't miss them
+    flush_pending_writes(WRITE_FLUSH_TIMEOUT)
+    with _CACHE_LOCK:
+        _CACHE['data'] = None
+        _CACHE['mtime'] = None
+
+def save_bookmarks(bookmarks):
+    """Save bookmarks to the cache and write them to file"""
+    # Handlers update the cached list and indexes in place before saving, so
+    # if the save fails drop them rather than serve changes that never landed
+    try:
+        data = _json_dumps(bookmarks)
+    except Exception:
+        _drop_cache()
+        raise
+    with _CACHE_LOCK:
+        _CACHE['data'] = bookmarks
+        _CACHE['version'] += 1
+        _CACHE['json_bytes'] = data
+        _CACHE['etag'] = None
+        _CACHE['categories_json'] = None
+        _CACHE['export_html'] = None
+    if WRITE_BEHIND:
+        _ensure_writer()
+        _write_queue.put(data)
+    else:
+        try:
+            _write_bookmarks_file(data)
+        except Exception:
+            _drop_cache()
+            raise
 
 @app.route('/')
 def home():
@@ -38,8 +278,28 @@ def home():
 
 @app.route('/api/bookmarks', methods=['GET'])
 def get_bookmarks():
-    """Get all bookmarks"""
-    return jsonify(load_bookmarks())
+    """Get all bookmarks, answering 304 when the client's copy is current"""
+    with _CACHE_LOCK:
+        bookmarks = _load_bookmarks_locked()
+        version = _CACHE['version']
+        data = _CACHE['json_bytes']
+        etag = _CACHE['etag']
+    
+    # Hash the exact bytes we send, and only publish them if no save has
+    # replaced the cached body in the meantime
+    if data is None or etag is None:
+        if data is None:
+            data = _json_dumps(bookmarks)
+        etag = hashlib.blake2b(data, digest_size=16).hexdigest()
+        with _CACHE_LOCK:
+            if _CACHE['version'] == version:
+                _CACHE['json_bytes'] = data
+                _CACHE['etag'] = etag
+    
+    from flask import Response
+    response = Response(data, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 @app.route('/api/bookmarks', methods=['POST'])
 def add_bookmark():
@@ -66,28 +326,30 @@ def add_bookmark():
     except:
         return jsonify({'error': 'Invalid URL format'}), 400
     
-    bookmarks = load_bookmarks()
-    
-    # Check for duplicate URL (case-insensitive)
-    normalized_url = url.lower().rstrip('/')
-    for bookmark in bookmarks:
-        existing_url = bookmark.get('url', '').lower().rstrip('/')
-        if existing_url == normalized_url:
+    with _MUTATION_LOCK:
+        bookmarks = load_bookmarks()
+        existing_urls = _CACHE['urls']
+        
+        # Check for duplicate URL (case-insensitive)
+        normalized_url = _normalize_url(url)
+        if normalized_url in existing_urls:
             return jsonify({'error': 'A bookmark with this URL already exists'}), 409
-    
-    new_bookmark = {
-        'id': str(datetime.now().timestamp()),
-        'title': data.get('title', '').strip(),
-        'url': url,
-        'description': data.get('description', '').strip(),
-        'tags': data.get('tags', []),
-        'category': data.get('category', '').strip() or 'Uncategorized',
-        'created': datetime.now().isoformat()
-    }
-    
-    bookmarks.append(new_bookmark)
-    save_bookmarks(bookmarks)
-    return jsonify(new_bookmark), 201
+        
+        new_bookmark = {
+            'id': secrets.token_hex(12),
+            'title': data.get('title', '').strip(),
+            'url': url,
+            'description': data.get('description', '').strip(),
+            'tags': data.get('tags', []),
+            'category': data.get('category', '').strip() or 'Uncategorized',
+            'created': datetime.now().isoformat()
+        }
+        
+        bookmarks.append(new_bookmark)
+        existing_urls[normalized_url] = new_bookmark['id']
+        _CACHE['by_id'][new_bookmark['id']] = new_bookmark
+        save_bookmarks(bookmarks)
+        return jsonify(new_bookmark), 201
 
 @app.route('/api/bookmarks/<bookmark_id>', methods=['PUT'])
 def update_bookmark(bookmark_id):
@@ -96,67 +358,74 @@ def update_bookmark(bookmark_id):
     if data is None:
         return jsonify({'error': 'Invalid JSON or missing Content-Type: application/json'}), 400
     
-    bookmarks = load_bookmarks()
-    
-    # Find the bookmark
-    bookmark_to_update = None
-    for bookmark in bookmarks:
-        if bookmark['id'] == bookmark_id:
-            bookmark_to_update = bookmark
-            break
-    
-    if not bookmark_to_update:
-        return jsonify({'error': 'Bookmark not found'}), 404
-    
-    # Validate and normalize URL if provided
-    if 'url' in data:
-        url = data.get('url', '').strip()
-        if not url:
-            return jsonify({'error': 'URL cannot be empty'}), 400
+    with _MUTATION_LOCK:
+        bookmarks = load_bookmarks()
         
-        # Normalize URL
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
+        # Find the bookmark
+        bookmark_to_update = _CACHE['by_id'].get(bookmark_id)
         
-        # Validate URL format
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
+        if not bookmark_to_update:
+            return jsonify({'error': 'Bookmark not found'}), 404
+        
+        updates = {}
+        
+        # Validate and normalize URL if provided
+        if 'url' in data:
+            url = data.get('url', '').strip()
+            if not url:
+                return jsonify({'error': 'URL cannot be empty'}), 400
+        
+            # Normalize URL
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+        
+            # Validate URL format
+            try:
+                from urllib.parse import urlparse
+                parsed = urlparse(url)
+                if not parsed.scheme or not parsed.netloc:
+                    return jsonify({'error': 'Invalid URL format'}), 400
+            except:
                 return jsonify({'error': 'Invalid URL format'}), 400
-        except:
-            return jsonify({'error': 'Invalid URL format'}), 400
         
-        # Check for duplicate URL (excluding current bookmark)
-        normalized_url = url.lower().rstrip('/')
-        for bookmark in bookmarks:
-            if bookmark['id'] != bookmark_id:
-                existing_url = bookmark.get('url', '').lower().rstrip('/')
-                if existing_url == normalized_url:
-                    return jsonify({'error': 'A bookmark with this URL already exists'}), 409
+            # Check for duplicate URL (excluding current bookmark)
+            existing_urls = _CACHE['urls']
+            normalized_url = _normalize_url(url)
+            if existing_urls.get(normalized_url, bookmark_id) != bookmark_id:
+                return jsonify({'error': 'A bookmark with this URL already exists'}), 409
         
-        bookmark_to_update['url'] = url
-    
-    # Update other fields
-    if 'title' in data:
-        bookmark_to_update['title'] = data.get('title', '').strip()
-    if 'description' in data:
-        bookmark_to_update['description'] = data.get('description', '').strip()
-    if 'tags' in data:
-        bookmark_to_update['tags'] = data.get('tags', [])
-    if 'category' in data:
-        bookmark_to_update['category'] = data.get('category', '').strip() or 'Uncategorized'
-    
-    save_bookmarks(bookmarks)
-    return jsonify(bookmark_to_update)
+            _forget_url(bookmark_to_update)
+            existing_urls[normalized_url] = bookmark_id
+            updates['url'] = url
+        
+        # Update other fields
+        if 'title' in data:
+            updates['title'] = data.get('title', '').strip()
+        if 'description' in data:
+            updates['description'] = data.get('description', '').strip()
+        if 'tags' in data:
+            updates['tags'] = data.get('tags', [])
+        if 'category' in data:
+            updates['category'] = data.get('category', '').strip() or 'Uncategorized'
+        
+        # Skip the file write entirely when nothing actually changed
+        changed = {k: v for k, v in updates.items() if bookmark_to_update.get(k) != v}
+        if changed:
+            bookmark_to_update.update(changed)
+            save_bookmarks(bookmarks)
+        return jsonify(bookmark_to_update)
 
 @app.route('/api/bookmarks/<bookmark_id>', methods=['DELETE'])
 def delete_bookmark(bookmark_id):
     """Delete a bookmark"""
-    bookmarks = load_bookmarks()
-    bookmarks = [b for b in bookmarks if b['id'] != bookmark_id]
-    save_bookmarks(bookmarks)
-    return jsonify({'success': True})
+    with _MUTATION_LOCK:
+        bookmarks = load_bookmarks()
+        bookmark = _CACHE['by_id'].pop(bookmark_id, None)
+        if bookmark:
+            bookmarks.remove(bookmark)
+            _forget_url(bookmark)
+            save_bookmarks(bookmarks)
+        return jsonify({'success': True})
 
 @app.route('/api/bookmarks/bulk', methods=['DELETE'])
 def bulk_delete_bookmarks():
@@ -169,24 +438,49 @@ def bulk_delete_bookmarks():
     if not isinstance(bookmark_ids, list):
         return jsonify({'error': 'ids must be an array'}), 400
     
-    bookmarks = load_bookmarks()
-    original_count = len(bookmarks)
-    bookmarks = [b for b in bookmarks if b['id'] not in bookmark_ids]
-    save_bookmarks(bookmarks)
+    try:
+        ids_set = frozenset(bookmark_ids)
+    except TypeError:
+        return jsonify({'error': 'ids must be an array of strings'}), 400
     
-    deleted_count = original_count - len(bookmarks)
-    return jsonify({'success': True, 'deleted': deleted_count})
+    with _MUTATION_LOCK:
+        bookmarks = load_bookmarks()
+        original_count = len(bookmarks)
+        
+        # Pop matches from the id index, then rebuild the list in one pass
+        by_id = _CACHE['by_id']
+        removed = [by_id.pop(bookmark_id) for bookmark_id in ids_set if bookmark_id in by_id]
+        if removed:
+            for bookmark in removed:
+                _forget_url(bookmark)
+            bookmarks = [b for b in bookmarks if b['id'] not in ids_set]
+            save_bookmarks(bookmarks)
+        
+        deleted_count = original_count - len(bookmarks)
+        return jsonify({'success': True, 'deleted': deleted_count})
 
 @app.route('/api/categories', methods=['GET'])
 def get_categories():
     """Get all unique categories"""
-    bookmarks = load_bookmarks()
-    categories = set()
-    for bookmark in bookmarks:
-        category = bookmark.get('category', 'Uncategorized')
-        if category:
-            categories.add(category)
-    return jsonify(sorted(list(categories)))
+    with _CACHE_LOCK:
+        bookmarks = _load_bookmarks_locked()
+        version = _CACHE['version']
+        data = _CACHE['categories_json']
+    
+    if data is None:
+        categories = set()
+        for bookmark in bookmarks:
+            category = bookmark.get('category', 'Uncategorized')
+            if category:
+                categories.add(category)
+        data = _json_dumps(sorted(list(categories)))
+        # Don't cache a list computed from bookmarks a save has since replaced
+        with _CACHE_LOCK:
+            if _CACHE['version'] == version:
+                _CACHE['categories_json'] = data
+    
+    from flask import Response
+    return Response(data, mimetype='application/json')
 
 @app.route('/api/import', methods=['POST'])
 def import_bookmarks():
@@ -199,64 +493,77 @@ def import_bookmarks():
         return jsonify({'error': 'No file selected'}), 400
     
     try:
-        content = file.read().decode('utf-8')
+        content = file.read()
         imported_bookmarks = parse_netscape_bookmarks(content)
         
         if not imported_bookmarks:
             return jsonify({'error': 'No bookmarks found in file'}), 400
         
-        bookmarks = load_bookmarks()
-        existing_urls = {b.get('url', '').lower().rstrip('/') for b in bookmarks}
-        
-        new_count = 0
-        skipped_count = 0
-        
-        for imported in imported_bookmarks:
-            normalized_url = imported['url'].lower().rstrip('/')
-            if normalized_url not in existing_urls:
-                imported['id'] = str(datetime.now().timestamp() + new_count)
-                imported['category'] = imported.get('category', 'Imported')
-                imported['tags'] = imported.get('tags', [])
-                imported['created'] = imported.get('created', datetime.now().isoformat())
-                bookmarks.append(imported)
-                existing_urls.add(normalized_url)
-                new_count += 1
-            else:
-                skipped_count += 1
-        
-        save_bookmarks(bookmarks)
-        return jsonify({
-            'success': True,
-            'imported': new_count,
-            'skipped': skipped_count,
-            'total': len(imported_bookmarks)
-        })
+        with _MUTATION_LOCK:
+            bookmarks = load_bookmarks()
+            existing_urls = _CACHE['urls']
+            
+            new_count = 0
+            skipped_count = 0
+            now = datetime.now().isoformat()
+            
+            for imported in imported_bookmarks:
+                normalized_url = _normalize_url(imported['url'])
+                if normalized_url not in existing_urls:
+                    imported['id'] = secrets.token_hex(12)
+                    imported['category'] = imported.get('category', 'Imported')
+                    imported['tags'] = imported.get('tags', [])
+                    imported['created'] = imported.get('created', now)
+                    bookmarks.append(imported)
+                    existing_urls[normalized_url] = imported['id']
+                    _CACHE['by_id'][imported['id']] = imported
+                    new_count += 1
+                else:
+                    skipped_count += 1
+            
+            save_bookmarks(bookmarks)
+            return jsonify({
+                'success': True,
+                'imported': new_count,
+                'skipped': skipped_count,
+                'total': len(imported_bookmarks)
+            })
     except Exception as e:
         return jsonify({'error': f'Error importing bookmarks: {str(e)}'}), 400
 
 def parse_netscape_bookmarks(content):
-    """Parse Netscape bookmark format HTML"""
+    """Parse Netscape bookmark format HTML from UTF-8 encoded bytes"""
     bookmarks = []
     
+    # Fallback for entries with an unparseable ADD_DATE, computed once
+    now = datetime.now().isoformat()
+    
     # Extract all <A> tags with HREF
-    pattern = r'<A\s+HREF="([^"]+)"[^>]*ADD_DATE="?(\d+)"?[^>]*>([^<]+)</A>'
-    matches = re.finditer(pattern, content, re.IGNORECASE)
+    matches = _NETSCAPE_A_RE.finditer(content)
     
     for match in matches:
-        url = match.group(1)
+        url = match.group(1).decode('utf-8')
         add_date = match.group(2)
-        title = match.group(3).strip()
+        title = match.group(3).decode('utf-8').strip()
         
         # Try to find description (DD tag after the A tag)
-        desc_pattern = r'<DD>([^<]+)'
-        desc_match = re.search(desc_pattern, content[match.end():match.end()+200])
-        description = desc_match.group(1).strip() if desc_match else ''
+        description = ''
+        desc_match = _NETSCAPE_DD_RE.search(content, match.end(), match.end() + _NETSCAPE_DD_WINDOW_BYTES)
+        if desc_match:
+            # Keep the window at 200 characters counted from the end of the
+            # <A> tag. The byte window may end mid-character; the incremental
+            # decoder holds that partial character back instead of failing,
+            # and it always falls past the character limit anyway.
+            limit = _NETSCAPE_DD_WINDOW - len(content[match.end():desc_match.start(1)].decode('utf-8'))
+            if limit > 0:
+                text = codecs.getincrementaldecoder('utf-8')().decode(desc_match.group(1))
+                description = text[:limit].strip()
         
         # Parse date
         try:
             created_date = datetime.fromtimestamp(int(add_date)).isoformat()
         except:
-            created_date = datetime.now().isoformat()
+            created_date = now
         
         # Normalize URL
         if not url.startswith(('http://', 'https://')):
@@ -274,254 +581,60 @@ def parse_netscape_bookmarks(content):
 @app.route('/api/export', methods=['GET'])
 def export_bookmarks():
     """Export bookmarks as standalone HTML page with glassmorphism design"""
-    bookmarks = load_bookmarks()
+    # Snapshot the list (deletes update the cached one in place) together
+    # with the version it belongs to
+    with _CACHE_LOCK:
+        bookmarks = list(_load_bookmarks_locked())
+        version = _CACHE['version']
+        cached_html = _CACHE['export_html']
+        cached_version = _CACHE['export_html_version']
+    exported_on = datetime.now().strftime('%B %d, %Y at %I:%M %p')
     
-    # Generate HTML with embedded CSS and glassmorphism design
-    html = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>My Bookmarks</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            min-height: 100vh;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 25%, #f093fb 50%, #4facfe 75%, #00f2fe 100%);
-            background-size: 400% 400%;
-            animation: gradientShift 15s ease infinite;
-            padding: 20px;
-            overflow-x: hidden;
-        }
-
-        @keyframes gradientShift {
-            0% { background-position: 0% 50%; }
-            50% { background-position: 100% 50%; }
-            100% { background-position: 0% 50%; }
-        }
-
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-        }
-
-        .header h1 {
-            color: white;
-            font-size: 3rem;
-            font-weight: 700;
-            text-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-            margin-bottom: 10px;
-        }
-
-        .header p {
-            color: rgba(255, 255, 255, 0.9);
-            font-size: 1.1rem;
-        }
-
-        .bookmarks-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            margin-top: 30px;
-        }
-
-        .bookmark-card {
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(20px);
-            -webkit-backdrop-filter: blur(20px);
-            border-radius: 16px;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            padding: 20px;
-            transition: all 0.3s ease;
-            animation: fadeIn 0.5s ease;
-        }
-
-        @keyframes fadeIn {
-            from {
-                opacity: 0;
-                transform: translateY(20px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-
-        .bookmark-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 12px 40px 0 rgba(31, 38, 135, 0.5);
-            background: rgba(255, 255, 255, 0.15);
-        }
-
-        .bookmark-title {
-            color: white;
-            font-size: 1.3rem;
-            font-weight: 700;
-            margin-bottom: 8px;
-            word-wrap: break-word;
-        }
-
-        .bookmark-title a {
-            color: white;
-            text-decoration: none;
-            transition: color 0.3s ease;
-        }
-
-        .bookmark-title a:hover {
-            color: rgba(255, 255, 255, 0.8);
-            text-decoration: underline;
-        }
-
-        .bookmark-url {
-            color: rgba(255, 255, 255, 0.7);
-            font-size: 0.9rem;
-            margin-bottom: 10px;
-            word-break: break-all;
-        }
-
-        .bookmark-description {
-            color: rgba(255, 255, 255, 0.8);
-            font-size: 0.95rem;
-            margin-bottom: 15px;
-            line-height: 1.5;
-        }
-
-        .bookmark-tags {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-            margin-bottom: 15px;
-        }
-
-        .tag {
-            background: rgba(255, 255, 255, 0.2);
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 0.8rem;
-            color: white;
-        }
-
-        .empty-state {
-            text-align: center;
-            padding: 60px 20px;
-            color: white;
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(20px);
-            border-radius: 20px;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }
-
-        .empty-state h2 {
-            font-size: 2rem;
-            margin-bottom: 10px;
-        }
-
-        .empty-state p {
-            font-size: 1.1rem;
-            opacity: 0.8;
-        }
-
-        @media (max-width: 768px) {
-            .header h1 {
-                font-size: 2rem;
-            }
-
-            .bookmarks-grid {
-                grid-template-columns: 1fr;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>✨ My Bookmarks</h1>
-            <p>Exported on ''' + datetime.now().strftime('%B %d, %Y at %I:%M %p') + '''</p>
-        </div>
-        <div class="bookmarks-grid">
-'''
+    from flask import Response, stream_template
+    headers = {'Content-Disposition': 'attachment; filename=my-bookmarks.html'}
     
-    if not bookmarks:
-        html += '''
-            <div class="empty-state">
-                <h2>📚 No bookmarks</h2>
-                <p>No bookmarks to display</p>
-            </div>
-'''
-    else:
-        # Escape HTML to prevent XSS
-        def escape_html(text):
-            return (str(text)
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&#x27;'))
-        
-        for bookmark in bookmarks:
-            title = bookmark.get('title', 'Untitled')
-            url = bookmark.get('url', '#')
-            description = bookmark.get('description', '')
-            tags = bookmark.get('tags', [])
-            
-            html += f'''
-            <div class="bookmark-card">
-                <div class="bookmark-title">
-                    <a href="{escape_html(url)}" target="_blank" rel="noopener noreferrer">
-                        {escape_html(title)}
-                    </a>
-                </div>
-                <div class="bookmark-url">{escape_html(url)}</div>
-'''
-            if description:
-                html += f'                <div class="bookmark-description">{escape_html(description)}</div>\n'
-            
-            if tags:
-                html += '                <div class="bookmark-tags">\n'
-                for tag in tags:
-                    html += f'                    <span class="tag">{escape_html(tag)}</span>\n'
-                html += '                </div>\n'
-            
-            html += '            </div>\n'
+    # The page only changes with the bookmarks, apart from the export date
+    if cached_html is not None and cached_version == version:
+        html = cached_html.replace(_EXPORT_DATE_SENTINEL, exported_on, 1)
+        return Response(html, mimetype='text/html', headers=headers)
     
-    html += '''        </div>
-    </div>
-</body>
-</html>'''
+    # Otherwise stream the page so large collections don't have to be built
+    # in memory first, and keep a copy with the date placeholder for next time
+    chunks = stream_template('export.html', bookmarks=bookmarks, exported_on=_EXPORT_DATE_SENTINEL)
     
-    from flask import Response
-    return Response(
-        html,
-        mimetype='text/html',
-        headers={'Content-Disposition': 'attachment; filename=my-bookmarks.html'}
-    )
+    def generate():
+        parts = []
+        date_pending = True
+        for chunk in chunks:
+            parts.append(chunk)
+            if date_pending and _EXPORT_DATE_SENTINEL in chunk:
+                chunk = chunk.replace(_EXPORT_DATE_SENTINEL, exported_on, 1)
+                date_pending = False
+            yield chunk
+        html = ''.join(parts)
+        with _CACHE_LOCK:
+            if _CACHE['version'] == version:
+                _CACHE['export_html'] = html
+                _CACHE['export_html_version'] = version
+    
+    return Response(generate(), mimetype='text/html', headers=headers)
 
 @app.route('/api/export/netscape', methods=['GET'])
 def export_bookmarks_netscape():
     """Export bookmarks as HTML (Netscape bookmark format for browser import)"""
-    bookmarks = load_bookmarks()
+    # Iterate over a shallow copy since deletes update the cached list in place
+    bookmarks = list(load_bookmarks())
     
-    # HTML escape function to prevent XSS attacks
-    def escape_html(text):
-        return (str(text)
-            .replace('&', '&amp;')
-            .replace('<', '&lt;')
-            .replace('>', '&gt;')
-            .replace('"', '&quot;')
-            .replace("'", '&#x27;'))
+    # Convert dates before streaming so a malformed one fails the request
+    # with a 500 instead of truncating a download that already started
+    now = int(datetime.now().timestamp())
+    add_dates = [
+        _iso_to_timestamp(b['created']) if b.get('created') is not None else now
+        for b in bookmarks
+    ]
     
-    html = '''<!DOCTYPE NETSCAPE-Bookmark-file-1>
+    def generate():
+        yield '''<!DOCTYPE NETSCAPE-Bookmark-file-1>
 <!-- This is an automatically generated file.
      It will be read and overwritten.
      DO NOT EDIT! -->
@@ -530,27 +643,22 @@ def export_bookmarks_netscape():
 <H1>Bookmarks</H1>
 <DL><p>
 '''
-    
-    for bookmark in bookmarks:
-        title = bookmark.get('title', 'Untitled')
-        url = bookmark.get('url', '#')
-        description = bookmark.get('description', '')
-        add_date = int(datetime.fromisoformat(bookmark.get('created', datetime.now().isoformat())).timestamp())
-        
-        # Escape all user input to prevent XSS
-        escaped_title = escape_html(title)
-        escaped_url = escape_html(url)
-        escaped_description = escape_html(description) if description else ''
+        for bookmark, add_date in zip(bookmarks, add_dates):
+            title = bookmark.get('title', 'Untitled')
+            url = bookmark.get('url', '#')
+            description = bookmark.get('description', '')
+            
+            # Escape all user input to prevent XSS
+            yield f'    <DT><A HREF="{escape_html(url)}" ADD_DATE="{add_date}">{escape_html(title)}</A>\n'
+            if description:
+                yield f'    <DD>{escape_html(description)}\n'
         
-        html += f'    <DT><A HREF="{escaped_url}" ADD_DATE="{add_date}">{escaped_title}</A>\n'
-        if description:
-            html += f'    <DD>{escaped_description}\n'
-    
-    html += '</DL><p>'
+        yield '</DL><p>'
     
+    # Stream the file instead of building it in memory first
     from flask import Response
     return Response(
-        html,
+        generate(),
         mimetype='text/html',
         headers={'Content-Disposition': 'attachment; filename=bookmarks-netscape.html'}
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,65 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+
+import index
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(index, 'BOOKMARKS_FILE', str(tmp_path / 'bookmarks.json'))
+    monkeypatch.setitem(index._CACHE, 'data', None)
+    monkeypatch.setitem(index._CACHE, 'mtime', None)
+    yield index.app.test_client()
+    index.flush_pending_writes()
+
+
+def test_bookmark_with_integer_beyond_64_bits_is_saved(client):
+    response = client.post('/api/bookmarks', json={'url': 'a.com', 'tags': [2 ** 70]})
+
+    assert response.status_code == 201
+    assert client.get('/api/bookmarks').get_json()[0]['tags'] == [2 ** 70]
+    assert client.post('/api/bookmarks', json={'url': 'b.com'}).status_code == 201
+
+    # And it round-trips through the file
+    index.flush_pending_writes()
+    index._CACHE['data'] = None
+    assert [b['url'] for b in client.get('/api/bookmarks').get_json()] == ['https://a.com', 'https://b.com']
+
+
+def test_failed_save_is_not_served_from_cache(client, monkeypatch):
+    assert client.post('/api/bookmarks', json={'url': 'a.com'}).status_code == 201
+    index.flush_pending_writes()
+
+    json_dumps = index._json_dumps
+
+    def fail(obj):
+        raise TypeError('boom')
+
+    monkeypatch.setattr(index, '_json_dumps', fail)
+    assert client.post('/api/bookmarks', json={'url': 'b.com'}).status_code == 500
+    monkeypatch.setattr(index, '_json_dumps', json_dumps)
+
+    assert [b['url'] for b in client.get('/api/bookmarks').get_json()] == ['https://a.com']
+    assert client.post('/api/bookmarks', json={'url': 'b.com'}).status_code == 201
+
+
+def test_conditional_get_sees_same_second_changes(client):
+    client.post('/api/bookmarks', json={'url': 'a.com'})
+    first = client.get('/api/bookmarks')
+    client.post('/api/bookmarks', json={'url': 'b.com'})
+
+    assert client.get('/api/bookmarks', headers={'If-None-Match': first.headers['ETag']}).status_code == 200
+    response = client.get('/api/bookmarks', headers={'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'})
+    assert response.status_code == 200
+    assert len(response.get_json()) == 2
+
+
+def test_netscape_export_with_malformed_date_fails_before_streaming(client):
+    with open(index.BOOKMARKS_FILE, 'w') as f:
+        f.write('[{"id": "1", "url": "https://a.com", "created": "not a date"}]')
+
+    assert client.get('/api/export/netscape').status_code == 500
@@ -0,0 +1,28 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+
+from index import parse_netscape_bookmarks
+
+
+def parse_description(description):
+    content = (
+        '<DT><A HREF="https://example.com" ADD_DATE="1700000000">Пример</A>\n'
+        f'<DD>{description}\n'
+    ).encode('utf-8')
+    bookmarks = parse_netscape_bookmarks(content)
+    assert len(bookmarks) == 1
+    assert bookmarks[0]['title'] == 'Пример'
+    return bookmarks[0]['description']
+
+
+def test_non_ascii_description_longer_than_200_bytes_is_kept():
+    assert parse_description('я' * 150) == 'я' * 150
+    assert parse_description('字' * 190) == '字' * 190
+
+
+def test_description_is_limited_to_200_characters_after_the_link():
+    # The window also covers the "\n<DD>" between the link and the text
+    assert parse_description('я' * 300) == 'я' * 195
+    assert parse_description('😀' * 300) == '😀' * 195